@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, List, Optional
+import hashlib
+import json
+import os
+
+from normalizer.loader import read_header_line
+
+
+@dataclass
+class Checkpoint:
+    source: str
+    offset: int
+    header_hash: str
+    delimiter: str
+    columns: List[str]
+    column_types: Dict[str, str]
+    rows: int
+    date_formats: Dict[str, List[str]] = field(default_factory=dict)
+    # byte size of each appended output when the checkpoint was written
+    output_sizes: Dict[str, int] = field(default_factory=dict)
+
+
+def header_hash(path: str | Path) -> str:
+    return hashlib.sha256(read_header_line(path)).hexdigest()
+
+
+def save_checkpoint(checkpoint: Checkpoint, outdir: Path, filename: str) -> Path:
+    # Write then rename, so a crash never leaves a half-written checkpoint
+    path = outdir / filename
+    tmp_path = outdir / f"{filename}.tmp"
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(asdict(checkpoint), f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+def record_output_sizes(checkpoint: Checkpoint, outdir: Path, filenames: List[str]) -> None:
+    checkpoint.output_sizes = {
+        name: (outdir / name).stat().st_size
+        for name in filenames
+        if (outdir / name).exists()
+    }
+
+
+def restore_outputs(checkpoint: Checkpoint, outdir: Path) -> None:
+    ##Drop anything appended to the outputs after the checkpoint was written
+    ##(a run that died before saving its checkpoint), so rows are not appended twice.
+    for name, size in checkpoint.output_sizes.items():
+        path = outdir / name
+        if path.exists() and path.stat().st_size > size:
+            with path.open("r+b") as f:
+                f.truncate(size)
+
+
+def load_checkpoint(path: str | Path) -> Optional[Checkpoint]:
+    # A missing or unreadable checkpoint just means "do a full run"
+    try:
+        with Path(path).open("r", encoding="utf-8") as f:
+            return Checkpoint(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def find_latest_checkpoint(base_out: Path, output_prefix: str, filename: str) -> Optional[Path]:
+    # Run folders are named <prefix>_<YYYY-MM-DD>, so name order is date order.
+    # Only the newest run folder can be resumed: a later full export replaces
+    # the outputs an older checkpoint would append to.
+    run_folders = sorted(p for p in base_out.glob(f"{output_prefix}_????-??-??") if p.is_dir())
+    if not run_folders:
+        return None
+    path = run_folders[-1] / filename
+    return path if path.is_file() else None
+
+
+def can_resume(checkpoint: Checkpoint, input_path: str | Path) -> bool:
+    ##The checkpoint must come from this same file, which must still start with
+    ##the same header and must not have shrunk (truncated or rewritten);
+    ##otherwise the caller falls back to a full run.
+    p = Path(input_path)
+    if not p.exists() or str(p.resolve()) != checkpoint.source:
+        return False
+    if p.stat().st_size < checkpoint.offset:
+        return False
+    return header_hash(p) == checkpoint.header_hash
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import re
 import pandas as pd
-from normalizer.profiler import _looks_date
+from normalizer.profiler import _parse_dates
 
 
 BOOL_TRUE = {"true", "yes", "1", "y", "t","oui"}
@@ -101,34 +101,67 @@ def _normalize_float(series: pd.Series) -> pd.Series:
     )
 
 
-def _normalize_date(series: pd.Series) -> pd.Series:
+def _normalize_date(series: pd.Series, formats: list[str] | None = None) -> tuple[pd.Series, int]:
+    # returns the parsed dates and how many values needed the slow fallback
     s = (
         series.astype("string")
         .str.strip()
         .replace({"": pd.NA, "null": pd.NA, "NULL": pd.NA})
     )
-    return pd.to_datetime(s, errors="coerce")
+    return _parse_dates(s, formats or [])
 
 
 
-def normalize_dataframe(df: pd.DataFrame, profiles) -> pd.DataFrame:
+_NORMALIZERS = {
+    "boolean": _normalize_boolean,
+    "integer": _normalize_integer,
+    "float": _normalize_float,
+    "date_month_middle": _normalize_date_month_middle,
+    "string": _normalize_string,
+}
+
+
+def normalize_with_types(
+    df: pd.DataFrame,
+    profiles,
+    frozen_types: dict[str, str] | None = None,
+    frozen_date_formats: dict[str, list[str]] | None = None,
+) -> tuple[pd.DataFrame, dict[str, str], dict[str, int]]:
+
+    ##Normalize a dataframe and return the normalizer used for each column,
+    ##plus, for date columns, how many values needed the slow fallback parser.
+    ##When `frozen_types` is given (e.g. from an incremental checkpoint) those
+    ##normalizers, and the `frozen_date_formats` of date columns, are applied
+    ##as-is instead of being inferred from the data.
+
     df = df.copy()
 
     # Normalize column names
     df.columns = [_normalize_column_name(c) for c in df.columns]
 
+    date_fallback_counts: dict[str, int] = {}
+
+    if frozen_types is not None:
+        frozen_date_formats = frozen_date_formats or {}
+        for col, kind in frozen_types.items():
+            if kind == "date":
+                df[col], date_fallback_counts[col] = _normalize_date(df[col], frozen_date_formats.get(col))
+            else:
+                df[col] = _NORMALIZERS[kind](df[col])
+        return df, dict(frozen_types), date_fallback_counts
+
+    column_types: dict[str, str] = {}
     for profile in profiles:
         col = _normalize_column_name(profile.name)
         series = df[col]
 
-        if profile.inferred_type == "boolean":
-            df[col] = _normalize_boolean(series)
-        elif profile.inferred_type == "integer":
-            df[col] = _normalize_integer(series)
-        elif profile.inferred_type == "float":
-            df[col] = _normalize_float(series)
-        elif profile.inferred_type == "date" or _looks_date(series):
-            df[col] = _normalize_date(series)
+        if profile.inferred_type in ("boolean", "integer", "float"):
+            kind = profile.inferred_type
+        elif profile.inferred_type == "date":
+            # explicit formats detected by the profiler; only residual values hit the slow fallback
+            df[col], date_fallback_counts[col] = _normalize_date(series, profile.date_formats)
+            column_types[col] = "date"
+            continue
         else:
             # Try deterministic month-middle date parsing first last chance in case it is a date and failed the panda's df check
             parsed = _normalize_date_month_middle(series)
@@ -136,8 +169,16 @@ def normalize_dataframe(df: pd.DataFrame, profiles) -> pd.DataFrame:
 
             if success_ratio >= 0.8 and parsed.notna().sum() > 0:
                 df[col] = parsed
-            else:
-                df[col] = _normalize_string(series)
+                column_types[col] = "date_month_middle"
+                continue
+            kind = "string"
 
+        df[col] = _NORMALIZERS[kind](series)
+        column_types[col] = kind
 
-    return df
+    return df, column_types, date_fallback_counts
+
+
+def normalize_dataframe(df: pd.DataFrame, profiles) -> pd.DataFrame:
+    df_clean, _, _ = normalize_with_types(df, profiles)
+    return df_clean
@@ -9,14 +9,26 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 
-from normalizer.loader import load_table, UnsupportedFileTypeError
+from normalizer.loader import load_table, load_csv_from_offset, _detect_delimiter, UnsupportedFileTypeError
 from normalizer.profiler import profile_dataframe
-from normalizer.cleaner import normalize_dataframe
+from normalizer.cleaner import normalize_with_types, _normalize_column_name
 from normalizer.schema import generate_create_table_sql, generate_json_schema
+from normalizer.checkpoint import (
+    Checkpoint,
+    can_resume,
+    find_latest_checkpoint,
+    header_hash,
+    load_checkpoint,
+    record_output_sizes,
+    restore_outputs,
+    save_checkpoint,
+)
 from normalizer.exporter import (
     ensure_outdir,
     export_clean_csv,
+    append_clean_csv,
     export_json_records,
+    export_ndjson_records,
     export_text,
     export_json,
 )
@@ -39,6 +51,69 @@ def _print_preview(df: pd.DataFrame, max_rows: int = 5) -> None:
     console.print(table)
 
 
+def _append_increment(
+    input_path: str,
+    out_path: Path,
+    checkpoint: Checkpoint,
+    output_prefix: str,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    ##Parse only the bytes appended since the checkpoint, normalize them with the
+    ##frozen column types and append them to the existing run folder outputs.
+    try:
+        df, end_offset = load_csv_from_offset(
+            input_path,
+            offset=checkpoint.offset,
+            columns=checkpoint.columns,
+            delim=checkpoint.delimiter,
+        )
+    except pd.errors.ParserError as e:
+        raise pd.errors.ParserError(
+            f"Could not parse the rows appended since the checkpoint, checkpoint left unchanged: {e}"
+        ) from e
+    df_clean, _, date_fallback_counts = normalize_with_types(
+        df,
+        [],
+        frozen_types=checkpoint.column_types,
+        frozen_date_formats=checkpoint.date_formats,
+    )
+
+    restore_outputs(checkpoint, out_path)
+    if not df_clean.empty:
+        clean_csv_path = append_clean_csv(df_clean, out_path, f"{output_prefix}_clean.csv")
+        ndjson_path = export_ndjson_records(
+            df_clean, out_path, f"{output_prefix}_data.ndjson", append=True
+        )
+
+    checkpoint.offset = end_offset
+    checkpoint.rows += int(len(df_clean))
+    record_output_sizes(
+        checkpoint, out_path, [f"{output_prefix}_clean.csv", f"{output_prefix}_data.ndjson"]
+    )
+    checkpoint_path = save_checkpoint(checkpoint, out_path, f"{output_prefix}_checkpoint.json")
+
+    report_path = out_path / f"{output_prefix}_report.json"
+    if report_path.exists():
+        with report_path.open("r", encoding="utf-8") as f:
+            report = json.load(f)
+        report["rows"] = checkpoint.rows
+        report["last_appended_rows"] = int(len(df_clean))
+        for entry in report.get("profiles", []):
+            col = _normalize_column_name(entry["name"])
+            if col in date_fallback_counts:
+                entry["date_fallback_count"] = entry.get("date_fallback_count", 0) + date_fallback_counts[col]
+        export_json(report, out_path, report_path.name)
+
+    if df_clean.empty:
+        console.print(f"\n[bold]Incremental run:[/bold] no new rows since the last checkpoint in {out_path}")
+        return df, df_clean
+
+    console.print(f"\n[bold]Incremental run:[/bold] {len(df_clean):,} new rows appended to {out_path}")
+    console.print(f"  • {clean_csv_path}")
+    console.print(f"  • {ndjson_path}")
+    console.print(f"  • {checkpoint_path}")
+    return df, df_clean
+
+
 @app.command()
 def run(
     input_path: str = typer.Argument(..., help="Path to input .csv or .xlsx/.xls file"),
@@ -49,6 +124,7 @@ def run(
     outdir: str = typer.Option("", "--out", help="Subfolder inside ./output (e.g. 'results')"),
     export_files: bool = typer.Option(False, "--export", help="Write outputs to files"),
     overwrite: bool = typer.Option(True,"--overwrite/--no-overwrite",help="Overwrite existing output files",),
+    incremental: bool = typer.Option(False, "--incremental", help="Only ingest rows appended to a CSV since the last run (implies --export)"),
 
 
 
@@ -67,78 +143,135 @@ def run(
     if sheet is not None and sheet.isdigit():
         sheet_val = int(sheet)
 
+    checkpoint_name = f"{output_prefix}_checkpoint.json"
+
     try:
-        df = load_table(input_path, sheet=sheet_val)
-        #if the file is empty 
-        if df.empty:
-            console.print("[red]Error:[/red] Input file contains no rows.")
-            raise typer.Exit(code=5)
-
-        profiles = profile_dataframe(df)
-        _print_profile(profiles)
-        df_clean = normalize_dataframe(df, profiles)
-        #in case there is an unsusable column 
-        if df_clean.shape[1] == 0:
-            console.print("[red]Error:[/red] No usable columns after normalization.")
-            raise typer.Exit(code=6)
-        create_sql = generate_create_table_sql(df_clean, table_name=table_name)
-        json_schema = generate_json_schema(df_clean, title=table_name)
-        if export_files:
-            base_root = ensure_outdir("output")  # always the root
+        resume: tuple[Path, Checkpoint] | None = None
+        if incremental:
+            export_files = True
+            base_root = ensure_outdir("output")
             base_out_path = ensure_outdir(base_root / outdir) if outdir else base_root
-
-            out_path = base_out_path / run_folder_name
-            if out_path.exists() and not overwrite:
-                console.print(f"[red]Error:[/red] Output folder already exists: {out_path}")
-                console.print("Run again with --overwrite or choose a different --out directory.")
-                raise typer.Exit(code=4)
-            out_path = ensure_outdir(base_out_path / run_folder_name)
-
-            clean_csv_path = export_clean_csv(
-            df_clean, out_path, f"{output_prefix}_clean.csv"
-            )
-            json_data_path = export_json_records(
-                df_clean, out_path, f"{output_prefix}_data.json"
-            )
-            sql_path = export_text(
-                create_sql, out_path, f"{output_prefix}_schema.sql"
-            )
-            json_schema_path = export_json(
-                json_schema, out_path, f"{output_prefix}_schema.json"
-            )
-            # simple report: profiles + row/col counts
-            report = {
-                "rows": int(len(df_clean)),
-                "columns": int(len(df_clean.columns)),
-                "profiles": [
-                    {
-                        "name": p.name,
-                        "inferred_type": p.inferred_type,
-                        "missing_pct": p.missing_pct,
-                        "unique_count": p.unique_count,
-                        "samples": p.samples,
-                    }
-                    for p in profiles
-                ],
-            }
+            checkpoint_path = find_latest_checkpoint(base_out_path, output_prefix, checkpoint_name)
+            if checkpoint_path is not None:
+                checkpoint = load_checkpoint(checkpoint_path)
+                if checkpoint is not None and can_resume(checkpoint, input_path):
+                    resume = (checkpoint_path.parent, checkpoint)
+                else:
+                    console.print("[yellow]Checkpoint does not match the input (other file, truncated or header changed), running a full ingestion.[/yellow]")
+
+        if resume is not None:
+            df, df_clean = _append_increment(input_path, resume[0], resume[1], output_prefix)
+        else:
+            if incremental:
+                delimiter = _detect_delimiter(input_path)
+                df, end_offset = load_csv_from_offset(input_path, delim=delimiter)
+            else:
+                df = load_table(input_path, sheet=sheet_val)
+            #if the file is empty 
+            if df.empty:
+                console.print("[red]Error:[/red] Input file contains no rows.")
+                raise typer.Exit(code=5)
+
+            profiles = profile_dataframe(df)
+            _print_profile(profiles)
+            df_clean, column_types, date_fallback_counts = normalize_with_types(df, profiles)
+            #in case there is an unsusable column 
+            if df_clean.shape[1] == 0:
+                console.print("[red]Error:[/red] No usable columns after normalization.")
+                raise typer.Exit(code=6)
+            create_sql = generate_create_table_sql(df_clean, table_name=table_name)
+            json_schema = generate_json_schema(df_clean, title=table_name)
+            if export_files:
+                base_root = ensure_outdir("output")  # always the root
+                base_out_path = ensure_outdir(base_root / outdir) if outdir else base_root
+
+                out_path = base_out_path / run_folder_name
+                if out_path.exists() and not overwrite:
+                    console.print(f"[red]Error:[/red] Output folder already exists: {out_path}")
+                    console.print("Run again with --overwrite or choose a different --out directory.")
+                    raise typer.Exit(code=4)
+                out_path = ensure_outdir(base_out_path / run_folder_name)
+
+                clean_csv_path = export_clean_csv(
+                df_clean, out_path, f"{output_prefix}_clean.csv"
+                )
+                if incremental:
+                    # NDJSON so that later incremental runs can append to it
+                    json_data_path = export_ndjson_records(
+                        df_clean, out_path, f"{output_prefix}_data.ndjson"
+                    )
+                    # a JSON array left by a plain --export would not get the appended rows
+                    (out_path / f"{output_prefix}_data.json").unlink(missing_ok=True)
+                else:
+                    json_data_path = export_json_records(
+                        df_clean, out_path, f"{output_prefix}_data.json"
+                    )
+                sql_path = export_text(
+                    create_sql, out_path, f"{output_prefix}_schema.sql"
+                )
+                json_schema_path = export_json(
+                    json_schema, out_path, f"{output_prefix}_schema.json"
+                )
+                # simple report: profiles + row/col counts
+                report = {
+                    "rows": int(len(df_clean)),
+                    "columns": int(len(df_clean.columns)),
+                    "profiles": [
+                        {
+                            "name": p.name,
+                            "inferred_type": p.inferred_type,
+                            "missing_pct": p.missing_pct,
+                            "unique_count": p.unique_count,
+                            "samples": p.samples,
+                            "date_formats": p.date_formats,
+                            "date_fallback_count": date_fallback_counts.get(_normalize_column_name(p.name), 0),
+                        }
+                        for p in profiles
+                    ],
+                }
             
-            report_path = export_json(
-                report, out_path, f"{output_prefix}_report.json"
-            )
-
-            console.print("\n[bold]Exported files:[/bold]")
-            console.print(f"  • {clean_csv_path}")
-            console.print(f"  • {json_data_path}")
-            console.print(f"  • {sql_path}")
-            console.print(f"  • {json_schema_path}")
-            console.print(f"  • {report_path}")
-
-        if show_schema:
-            console.print("\n[bold]SQL Schema (CREATE TABLE)[/bold]")
-            console.print(create_sql)
-
-            console.print("\n[bold]JSON Schema[/bold]")
-            console.print_json(json.dumps(json_schema))
+                report_path = export_json(
+                    report, out_path, f"{output_prefix}_report.json"
+                )
+
+                console.print("\n[bold]Exported files:[/bold]")
+                console.print(f"  • {clean_csv_path}")
+                console.print(f"  • {json_data_path}")
+                console.print(f"  • {sql_path}")
+                console.print(f"  • {json_schema_path}")
+                console.print(f"  • {report_path}")
+
+                if incremental:
+                    checkpoint = Checkpoint(
+                        source=str(input_path_obj.resolve()),
+                        offset=end_offset,
+                        header_hash=header_hash(input_path),
+                        delimiter=delimiter,
+                        columns=[str(c) for c in df.columns],
+                        column_types=column_types,
+                        rows=int(len(df_clean)),
+                        date_formats={
+                            _normalize_column_name(p.name): p.date_formats
+                            for p in profiles
+                            if p.date_formats
+                        },
+                    )
+                    record_output_sizes(
+                        checkpoint, out_path, [clean_csv_path.name, json_data_path.name]
+                    )
+                    checkpoint_path = save_checkpoint(checkpoint, out_path, checkpoint_name)
+                    console.print(f"  • {checkpoint_path}")
+                else:
+                    # a full export replaces the outputs a checkpoint would append to
+                    (out_path / checkpoint_name).unlink(missing_ok=True)
+                    (out_path / f"{output_prefix}_data.ndjson").unlink(missing_ok=True)
+
+            if show_schema:
+                console.print("\n[bold]SQL Schema (CREATE TABLE)[/bold]")
+                console.print(create_sql)
+
+                console.print("\n[bold]JSON Schema[/bold]")
+                console.print_json(json.dumps(json_schema))
 
 
 
@@ -148,6 +281,9 @@ def run(
     except UnsupportedFileTypeError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=2)
+    except pd.errors.ParserError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(code=3)
     except Exception as e:
         console.print(f"[red]Unexpected error while reading file:[/red] {e}")
         raise typer.Exit(code=3)
@@ -26,6 +26,26 @@ def export_json_records(df: pd.DataFrame, outdir: Path, filename: str = "data.js
     return path
 
 
+def append_clean_csv(df: pd.DataFrame, outdir: Path, filename: str = "clean.csv") -> Path:
+    # Append rows to an existing clean CSV (header already written by the first run)
+    path = outdir / filename
+    df.to_csv(path, mode="a", header=not path.exists(), index=False)
+    return path
+
+
+def export_ndjson_records(
+    df: pd.DataFrame, outdir: Path, filename: str = "data.ndjson", append: bool = False
+) -> Path:
+    path = outdir / filename
+    # One JSON object per line so later runs can append without rewriting the file
+    records = df.where(df.notna(), None).to_dict(orient="records")
+    with path.open("a" if append else "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, default=str))
+            f.write("\n")
+    return path
+
+
 def export_text(text: str, outdir: Path, filename: str) -> Path:
     path = outdir / filename
     path.write_text(text, encoding="utf-8")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+import csv
+import io
 import pandas as pd
 
 
@@ -31,16 +33,88 @@ def _detect_delimiter(path: str | Path) -> str:
     return best_delim
 
 
-def _read_csv_robust(path: str | Path) -> pd.DataFrame:
-    delim = _detect_delimiter(path)
+def _read_csv_robust(path: str | Path, delim: str | None = None, **kwargs) -> pd.DataFrame:
+    if delim is None:
+        delim = _detect_delimiter(path)
     return pd.read_csv(
         path,
         sep=delim,
         encoding="utf-8-sig",
         engine="c",
-        dtype=str,            # keeps raw values; your normalizer can infer later
-        keep_default_na=False # prevents "NA" becoming NaN unexpectedly
+        dtype=str,             # keeps raw values; your normalizer can infer later
+        keep_default_na=False, # prevents "NA" becoming NaN unexpectedly
+        **kwargs,
     )
+
+
+def read_header_line(path: str | Path) -> bytes:
+    # Raw first line (without line ending), used to detect header changes between runs.
+    with open(path, "rb") as f:
+        return f.readline().rstrip(b"\r\n")
+
+
+def _complete_records_end(data: bytes) -> int:
+    # End of the last complete record: the last newline outside of a quoted field.
+    # Escaped quotes ("") come in pairs, so an even quote count before it means "outside".
+    nl = data.rfind(b"\n")
+    if nl == -1:
+        return 0
+    quotes = data.count(b'"', 0, nl)
+    while quotes % 2:
+        prev = data.rfind(b"\n", 0, nl)
+        if prev == -1:
+            return 0
+        quotes -= data.count(b'"', prev, nl)
+        nl = prev
+    return nl + 1
+
+
+def load_csv_from_offset(
+    path: str | Path,
+    offset: int = 0,
+    columns: list[str] | None = None,
+    delim: str | None = None,
+) -> tuple[pd.DataFrame, int]:
+
+    ##Load the rows of a CSV starting at a byte offset.
+    ##- offset 0: reads the header and every row (full load)
+    ##- offset > 0: reads only the bytes appended since, using `columns` as header
+    ##Only complete records are consumed (a quoted field may span lines);
+    ##returns the rows and the offset to resume from.
+
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(f"File not found: {p}")
+    if p.suffix.lower() != ".csv":
+        raise UnsupportedFileTypeError(f"Incremental loading only supports .csv files, got: {p.suffix.lower()}")
+
+    with open(p, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+
+    # a last record without newline (or with an unclosed quote) may still be being written: leave it for the next run
+    data = data[: _complete_records_end(data)]
+    end_offset = offset + len(data)
+
+    if offset == 0:
+        df = _read_csv_robust(io.BytesIO(data), delim=delim or _detect_delimiter(p))
+        return df, end_offset
+
+    if not data.strip():
+        return pd.DataFrame(columns=columns, dtype=str), end_offset
+
+    # be as strict as a full read: every appended record must match the header
+    text = data.decode("utf-8-sig", errors="replace")
+    for n, record in enumerate(csv.reader(io.StringIO(text), delimiter=delim), start=1):
+        if record and len(record) != len(columns):
+            raise pd.errors.ParserError(
+                f"Expected {len(columns)} fields in appended record {n}, saw {len(record)}"
+            )
+
+    df = _read_csv_robust(io.BytesIO(data), delim=delim, header=None, names=columns, index_col=False)
+    return df, end_offset
+
+
 def load_table(path: str | Path, sheet: str | int | None = None) -> pd.DataFrame:
     
     ##Load a CSV or Excel file into a DataFrame.
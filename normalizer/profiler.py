@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
 import pandas as pd
@@ -14,11 +14,48 @@ class ColumnProfile:
     missing_pct: float
     unique_count: int
     samples: List[str]
+    date_formats: List[str] = field(default_factory=list)
 
 
 BOOL_TRUE = {"true", "yes", "1", "y", "t","oui"}
 BOOL_FALSE = {"false", "no", "0", "n", "f","non"}
 
+# Candidate formats for date columns. Ambiguous day/month orders list month-first
+# first, matching what pandas' own inference picks on a tie. %z also accepts "Z".
+DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%m-%d-%Y",
+    "%d-%m-%Y",
+    "%m.%d.%Y",
+    "%d.%m.%Y",
+    "%Y%m%d",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S.%f%z",
+    "%m/%d/%Y %H:%M",
+    "%d/%m/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%b %d %Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+]
+DATE_SAMPLE_SIZE = 1000
+MAX_DATE_FORMATS = 3
+MIN_DATE_FORMAT_SHARE = 0.05
+
 
 def _looks_boolean(series: pd.Series) -> bool:
     values = (
@@ -49,37 +86,140 @@ def _looks_float(series: pd.Series) -> bool:
         return False
 
 
-def _looks_date(series: pd.Series) -> bool:
+def _infer_date_formats(values: pd.Series) -> list[str]:
+
+    ##Detect the dominant explicit format(s) of a date column from a sample.
+    ##Greedy: keep the format matching most of the remaining sample values,
+    ##until formats stop covering a meaningful share of the sample.
+
+    sample = values.drop_duplicates().head(DATE_SAMPLE_SIZE)
+    remaining = sample
+    formats: list[str] = []
+
+    while len(formats) < MAX_DATE_FORMATS and not remaining.empty:
+        best_fmt = None
+        best_hits = None
+        for fmt in DATE_FORMATS:
+            if fmt in formats:
+                continue
+            hits = _to_datetime(remaining, fmt).notna()
+            if best_hits is None or hits.sum() > best_hits.sum():
+                best_fmt, best_hits = fmt, hits
+
+        if best_hits is None or best_hits.sum() < max(1, MIN_DATE_FORMAT_SHARE * len(sample)):
+            break
+        formats.append(best_fmt)
+        remaining = remaining[~best_hits]
+
+    return formats
+
+
+def _to_utc_naive(parsed: pd.Series) -> pd.Series:
+    if getattr(parsed.dtype, "tz", None) is None:
+        return parsed
+    return parsed.dt.tz_convert("UTC").dt.tz_localize(None)
+
+
+def _to_datetime(values: pd.Series, fmt: str | None = None) -> pd.Series:
+    # Values sharing one UTC offset keep it. Mixed offsets (which pandas refuses
+    # to put in one column) are converted to UTC and stored naive.
     try:
-        s = (
-            series.dropna()
-            .astype(str)
-            .str.strip()
-            .replace("", pd.NA) #we can ignore white spaces or null charaacters
-            .dropna()
-        )
-        if s.empty:
-            return False
-        # mixed date formats are expected; silence pandas inference warning
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            parsed = pd.to_datetime(s, errors="coerce")
-        return parsed.notna().mean() >= 0.8
-    except Exception:
-        return False
+        parsed = pd.to_datetime(values, format=fmt, errors="coerce")
+    except ValueError:
+        return _to_utc_naive(pd.to_datetime(values, format=fmt, errors="coerce", utc=True))
+    if fmt is None and getattr(parsed.dtype, "tz", None) is not None and parsed.isna().sum() > values.isna().sum():
+        # inference coerces naive values next to offset ones to NaT: keep them, in UTC
+        return _to_utc_naive(pd.to_datetime(values, errors="coerce", utc=True))
+    return parsed
 
 
+def _fallback_dates(values: pd.Series) -> pd.Series:
+    # mixed date formats are expected; the fallback count is reported instead
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        return _to_datetime(values)
 
-def infer_type(series: pd.Series) -> str:
+
+def _combine_dates(pieces: list[pd.Series]) -> pd.Series:
+    # Pieces parsed with different formats must end up in one datetime64 column:
+    # if they disagree on the UTC offset (or naive vs offset), use naive UTC.
+    if len({str(getattr(p.dtype, "tz", None)) for p in pieces}) > 1:
+        pieces = [_to_utc_naive(p) for p in pieces]
+    # let pandas pick the resolution (e.g. 9999-12-31 does not fit in nanoseconds)
+    return pd.concat(pieces)
+
+
+def _parse_dates(values: pd.Series, formats: list[str]) -> tuple[pd.Series, int]:
+
+    ##Parse dates with each explicit format in turn (vectorized passes).
+    ##Only the values no format matched go to pandas' per-element inference.
+    ##Returns the parsed series and how many values needed that slow fallback.
+
+    todo = values.notna()
+    if not formats or not todo.any():
+        return _fallback_dates(values), int(todo.sum())
+
+    index = values.index
+    values = values.reset_index(drop=True)
+    todo = todo.reset_index(drop=True)
+    pieces = []
+
+    for fmt in formats:
+        if not todo.any():
+            break
+        matched = _to_datetime(values[todo], fmt).dropna()
+        if not matched.empty:
+            pieces.append(matched)
+            todo[matched.index] = False
+
+    fallback_count = int(todo.sum())
+    if fallback_count:
+        pieces.append(_fallback_dates(values[todo]))
+
+    parsed = _combine_dates(pieces).reindex(values.index) if pieces else _fallback_dates(values)
+    parsed.index = index
+    return parsed, fallback_count
+
+
+def _date_profile(series: pd.Series) -> tuple[bool, list[str]]:
+    s = (
+        series.dropna()
+        .astype(str)
+        .str.strip()
+        .replace("", pd.NA) #we can ignore white spaces or null charaacters
+        .dropna()
+    )
+    if s.empty:
+        return False, []
+    formats = _infer_date_formats(s)
+    if not formats:
+        # no explicit format matched the sample: decide on the sample before
+        # sending the whole column through the slow per-value fallback
+        sample = s.head(DATE_SAMPLE_SIZE)
+        if _fallback_dates(sample).notna().mean() < 0.8:
+            return False, []
+    parsed, _ = _parse_dates(s, formats)
+    return parsed.notna().mean() >= 0.8, formats
+
+
+def _infer_type_and_dates(series: pd.Series) -> tuple[str, list[str]]:
     if _looks_boolean(series):
-        return "boolean"
+        return "boolean", []
     if _looks_integer(series):
-        return "integer"
+        return "integer", []
     if _looks_float(series):
-        return "float"
-    if _looks_date(series):
-        return "date"
-    return "string"
+        return "float", []
+    try:
+        is_date, formats = _date_profile(series)
+    except Exception:
+        is_date = False
+    if is_date:
+        return "date", formats
+    return "string", []
+
+
+def infer_type(series: pd.Series) -> str:
+    return _infer_type_and_dates(series)[0]
 
 
 def profile_dataframe(df: pd.DataFrame, sample_size: int = 3) -> list[ColumnProfile]:
@@ -93,7 +233,7 @@ def profile_dataframe(df: pd.DataFrame, sample_size: int = 3) -> list[ColumnProf
         missing_pct = series.isna().mean() * 100
         unique_count = series.nunique(dropna=True)
 
-        inferred = infer_type(series)
+        inferred, date_formats = _infer_type_and_dates(series)
 
         samples = (
             series.dropna()
@@ -109,6 +249,7 @@ def profile_dataframe(df: pd.DataFrame, sample_size: int = 3) -> list[ColumnProf
                 missing_pct=round(missing_pct, 2),
                 unique_count=int(unique_count),
                 samples=samples,
+                date_formats=date_formats,
             )
         )
 